@@ -0,0 +1,21 @@
+from pyperf import Runner
+
+from aiodynamo.models import BatchWriteRequest
+from aiodynamo.operations import Put
+from utils import generate_items
+
+
+items = generate_items()
+
+
+def encode_put_operations():
+    result = [Put("table", item).to_request_payload() for item in items]
+
+
+def encode_batch_write():
+    result = BatchWriteRequest(items_to_put=items).to_request_payload()
+
+
+runner = Runner()
+runner.bench_func("encode_put_operations", encode_put_operations)
+runner.bench_func("encode_batch_write", encode_batch_write)
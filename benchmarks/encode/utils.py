@@ -0,0 +1,15 @@
+def generate_items(num_items=1000):
+    return [
+        {
+            "hash": f"hash-{index}",
+            "range": index,
+            "null": None,
+            "flag": index % 2 == 0,
+            "float": index * 4.2,
+            "numeric_set": {index, index * 2},
+            "string_set": {"hello", "world"},
+            "list": ["hello", index, None],
+            "map": {"nested": {"key": f"value-{index}"}},
+        }
+        for index in range(num_items)
+    ]
@@ -4,10 +4,7 @@ import asyncio
 import json
 from collections.abc import AsyncIterator, Mapping, Sequence
 from dataclasses import dataclass
-from typing import (
-    Any,
-    cast,
-)
+from typing import Any
 
 from yarl import URL
 
@@ -54,6 +51,7 @@ from .models import (
     RetryTimeout,
     ReturnValues,
     Select,
+    StreamedPage,
     StreamSpecification,
     TableDescription,
     TableStatus,
@@ -238,6 +236,35 @@ class Table:
             consistent_read=consistent_read,
         )
 
+    async def query_single_page_streamed(
+        self,
+        key_condition: KeyCondition,
+        *,
+        start_key: dict[str, Any] | None = None,
+        filter_expression: Condition | None = None,
+        scan_forward: bool = True,
+        index: str | None = None,
+        limit: int | None = None,
+        projection: ProjectionExpression | None = None,
+        select: Select = Select.all_attributes,
+        consistent_read: bool = False,
+    ) -> StreamedPage:
+        """
+        Query a single DynamoDB page, deserializing items lazily.
+        """
+        return await self.client.query_single_page_streamed(
+            self.name,
+            key_condition,
+            start_key=start_key,
+            filter_expression=filter_expression,
+            scan_forward=scan_forward,
+            index=index,
+            limit=limit,
+            projection=projection,
+            select=select,
+            consistent_read=consistent_read,
+        )
+
     def scan(
         self,
         *,
@@ -293,6 +320,29 @@ class Table:
             consistent_read=consistent_read,
         )
 
+    async def scan_single_page_streamed(
+        self,
+        *,
+        index: str | None = None,
+        limit: int | None = None,
+        start_key: dict[str, Any] | None = None,
+        projection: ProjectionExpression | None = None,
+        filter_expression: Condition | None = None,
+        consistent_read: bool = False,
+    ) -> StreamedPage:
+        """
+        Scan a single DynamoDB page, deserializing items lazily.
+        """
+        return await self.client.scan_single_page_streamed(
+            table=self.name,
+            index=index,
+            limit=limit,
+            start_key=start_key,
+            projection=projection,
+            filter_expression=filter_expression,
+            consistent_read=consistent_read,
+        )
+
     async def count(
         self,
         key_condition: KeyCondition,
@@ -518,7 +568,7 @@ class Client:
         if condition:
             params = Parameters()
             payload["ConditionExpression"] = condition.encode(params)
-            payload.update(params.to_request_payload())
+            payload |= params.to_request_payload()
 
         resp = await self.send_request(action="DeleteItem", payload=payload)
         if "Attributes" in resp:
@@ -565,7 +615,7 @@ class Client:
         if projection:
             params = Parameters()
             payload["ProjectionExpression"] = projection.encode(params)
-            payload.update(params.to_request_payload())
+            payload |= params.to_request_payload()
 
         resp = await self.send_request(action="GetItem", payload=payload)
         if "Item" in resp:
@@ -593,7 +643,7 @@ class Client:
         if condition:
             params = Parameters()
             payload["ConditionExpression"] = condition.encode(params)
-            payload.update(params.to_request_payload())
+            payload |= params.to_request_payload()
 
         resp = await self.send_request(action="PutItem", payload=payload)
 
@@ -684,6 +734,54 @@ class Client:
             last_evaluated_key=last_evaluated_key,
         )
 
+    async def query_single_page_streamed(
+        self,
+        table: TableName,
+        key_condition: KeyCondition,
+        *,
+        start_key: dict[str, Any] | None = None,
+        filter_expression: Condition | None = None,
+        scan_forward: bool = True,
+        index: str | None = None,
+        limit: int | None = None,
+        projection: ProjectionExpression | None = None,
+        select: Select = Select.all_attributes,
+        consistent_read: bool = False,
+    ) -> StreamedPage:
+        """
+        Query a single DynamoDB page, deserializing items lazily.
+        Like query_single_page(...), but items are only deserialized while
+        iterating the returned page, so the fully deserialized item list is
+        never materialized.
+        """
+        payload = _query_payload(
+            table=table,
+            key_condition=key_condition,
+            start_key=start_key,
+            filter_expression=filter_expression,
+            scan_forward=scan_forward,
+            index=index,
+            projection=projection,
+            select=select,
+            consistent_read=consistent_read,
+        )
+        if limit is not None:
+            payload["Limit"] = limit
+
+        response = await self.send_request(action="Query", payload=payload)
+
+        last_evaluated_key: dict[str, Any] | None
+        try:
+            last_evaluated_key = dy2py(response["LastEvaluatedKey"], self.numeric_type)
+        except KeyError:
+            last_evaluated_key = None
+
+        return StreamedPage(
+            raw_items=response["Items"],
+            last_evaluated_key=last_evaluated_key,
+            numeric_type=self.numeric_type,
+        )
+
     async def scan(
         self,
         table: TableName,
@@ -756,6 +854,50 @@ class Client:
             last_evaluated_key=last_evaluated_key,
         )
 
+    async def scan_single_page_streamed(
+        self,
+        table: TableName,
+        *,
+        index: str | None = None,
+        limit: int | None = None,
+        start_key: dict[str, Any] | None = None,
+        projection: ProjectionExpression | None = None,
+        filter_expression: Condition | None = None,
+        consistent_read: bool = False,
+    ) -> StreamedPage:
+        """
+        Scan a single DynamoDB page, deserializing items lazily.
+        Like scan_single_page(...), but items are only deserialized while
+        iterating the returned page, so the fully deserialized item list is
+        never materialized.
+        """
+
+        payload = _scan_payload(
+            table=table,
+            index=index,
+            start_key=start_key,
+            projection=projection,
+            filter_expression=filter_expression,
+            consistent_read=consistent_read,
+        )
+
+        if limit is not None:
+            payload["Limit"] = limit
+
+        response = await self.send_request(action="Scan", payload=payload)
+
+        last_evaluated_key: dict[str, Any] | None
+        try:
+            last_evaluated_key = dy2py(response["LastEvaluatedKey"], self.numeric_type)
+        except KeyError:
+            last_evaluated_key = None
+
+        return StreamedPage(
+            raw_items=response["Items"],
+            last_evaluated_key=last_evaluated_key,
+            numeric_type=self.numeric_type,
+        )
+
     async def count(
         self,
         table: TableName,
@@ -782,7 +924,7 @@ class Client:
             payload["FilterExpression"] = filter_expression.encode(params)
         if index:
             payload["IndexName"] = index
-        payload.update(params.to_request_payload())
+        payload |= params.to_request_payload()
 
         count_sum = 0
         async for result in self._depaginate("Query", payload, limit):
@@ -842,7 +984,7 @@ class Client:
         if condition:
             payload["ConditionExpression"] = condition.encode(params)
 
-        payload.update(params.to_request_payload())
+        payload |= params.to_request_payload()
 
         resp = await self.send_request(action="UpdateItem", payload=payload)
 
@@ -996,7 +1138,8 @@ class Client:
                     continue
                 response_logger.debug("got response %r", response)
                 if response.status == 200:
-                    return cast(dict[str, Any], json.loads(response.body))
+                    result: dict[str, Any] = json.loads(response.body)
+                    return result
                 exception = exception_from_response(response.status, response.body)
                 if isinstance(exception, Throttled):
                     logger.debug("request throttled")
@@ -1101,7 +1244,7 @@ def _query_payload(
     if select:
         payload["Select"] = select.value
 
-    payload.update(params.to_request_payload())
+    payload |= params.to_request_payload()
     return payload
 
 
@@ -1130,5 +1273,5 @@ def _scan_payload(
     if filter_expression:
         payload["FilterExpression"] = filter_expression.encode(params)
 
-    payload.update(params.to_request_payload())
+    payload |= params.to_request_payload()
     return payload
@@ -13,7 +13,6 @@ from pathlib import Path
 from typing import (
     Generic,
     TypeVar,
-    cast,
 )
 
 from yarl import URL
@@ -175,7 +174,7 @@ class FileCredentials(Credentials):
         profile_name: str | None = None,
     ) -> None:
         if profile_name is None:
-            profile_name = cast(str, os.environ.get("AWS_PROFILE", "default"))
+            profile_name = os.environ.get("AWS_PROFILE", "default")
         if path is None:
             path = Path.home().joinpath(".aws", "credentials")
         self.key = None
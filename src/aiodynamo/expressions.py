@@ -14,6 +14,12 @@ from .utils import deparametetrize, low_level_serialize
 
 _ParametersCache = dict[tuple[Any, Any], str]
 
+# Placeholders are generated for every encoded attribute name and value, so
+# the common low indices are formatted once at import time instead of per
+# encode call.
+_NAME_PLACEHOLDERS = tuple(f"#n{index}" for index in range(1024))
+_VALUE_PLACEHOLDERS = tuple(f":v{index}" for index in range(1024))
+
 Addable = Numeric | set[bytes] | set[str] | set[Numeric]
 
 
@@ -295,12 +301,19 @@ class Parameters:
 
     def encode_name(self, name: str | int) -> str:
         return self._encode(
-            "#n", name, self.names, self.names_gen, self.names_cache, name
+            _NAME_PLACEHOLDERS,
+            "#n",
+            name,
+            self.names,
+            self.names_gen,
+            self.names_cache,
+            name,
         )
 
     def encode_value(self, value: Any) -> str:
         tag, value = low_level_serialize(value)
         return self._encode(
+            _VALUE_PLACEHOLDERS,
             ":v",
             {tag: value},
             self.values,
@@ -327,13 +340,22 @@ class Parameters:
         if self.names:
             payload["ExpressionAttributeNames"] = self.names
         if self.values:
-            payload["ExpressionAttributeValues"] = {
-                key: value for key, value in self.values.items()
-            }
+            payload["ExpressionAttributeValues"] = self.values
         return payload
 
+    def write_into(self, target: dict[str, Any]) -> None:
+        """
+        Write the collected names and values directly into a request payload,
+        avoiding the intermediate dict to_request_payload allocates.
+        """
+        if self.names:
+            target["ExpressionAttributeNames"] = self.names
+        if self.values:
+            target["ExpressionAttributeValues"] = self.values
+
     def _encode(
         self,
+        placeholders: tuple[str, ...],
         prefix: str,
         thing: Any,
         data: dict[str, Any],
@@ -348,7 +370,10 @@ class Parameters:
         except TypeError:
             can_cache = False
 
-        encoded = f"{prefix}{next(index_gen)}"
+        index = next(index_gen)
+        encoded = (
+            placeholders[index] if index < len(placeholders) else f"{prefix}{index}"
+        )
         data[encoded] = thing
         if can_cache:
             cache[cache_key] = encoded
@@ -1,21 +1,17 @@
 from __future__ import annotations
 
-import abc
 import asyncio
 import datetime
 import random
 import time
-from collections.abc import AsyncIterable, Iterable, Iterator
-from dataclasses import dataclass
+from collections.abc import AsyncIterable, Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import Enum, unique
-from itertools import count
-from typing import (
-    Any,
-    cast,
-)
+from typing import Any
 
 from .expressions import Parameters, ProjectionExpression
 from .types import (
+    DynamoItem,
     EncodedGlobalSecondaryIndex,
     EncodedKeySchema,
     EncodedLocalSecondaryIndex,
@@ -24,10 +20,11 @@ from .types import (
     EncodedStreamSpecification,
     EncodedThroughput,
     Item,
+    NumericTypeConverter,
     Seconds,
     TableName,
 )
-from .utils import py2dy
+from .utils import dy2py, py2dy
 
 
 @unique
@@ -38,33 +35,53 @@ class TimeToLiveStatus(Enum):
     disabled = "DISABLED"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeToLiveDescription:
     table: str
     attribute: str
     status: TimeToLiveStatus
 
 
-@dataclass(frozen=True)
+# The encode() results below are precomputed at construction time: the
+# dataclasses are frozen, so the encoded form never changes. Callers must
+# treat the returned structures as read-only.
+
+
+@dataclass(frozen=True, slots=True)
 class Throughput:
     read: int
     write: int
+    _encoded: EncodedThroughput = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_encoded",
+            {
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": self.read,
+                    "WriteCapacityUnits": self.write,
+                }
+            },
+        )
 
     def encode(self) -> EncodedThroughput:
-        return {
-            "ProvisionedThroughput": {
-                "ReadCapacityUnits": self.read,
-                "WriteCapacityUnits": self.write,
-            }
-        }
+        return self._encoded
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PayPerRequest:
     MODE = "PAY_PER_REQUEST"
 
     def encode(self) -> EncodedPayPerRequest:
-        return {"BillingMode": PayPerRequest.MODE}
+        return _PAY_PER_REQUEST_ENCODED
+
+
+_PAY_PER_REQUEST_ENCODED: EncodedPayPerRequest = {"BillingMode": PayPerRequest.MODE}
+
+# PayPerRequest carries no state, so a single shared instance serves all
+# callers; instances compare equal either way.
+PAY_PER_REQUEST = PayPerRequest()
 
 
 ThroughputType = Throughput | PayPerRequest
@@ -76,57 +93,95 @@ class KeyType(Enum):
     binary = "B"
 
 
-@dataclass(frozen=True)
+# Enum attribute access goes through a descriptor; the encode paths below run
+# per key per request, so they look the string values up in plain dicts
+# populated once at import time instead. The reverse maps let response
+# parsing bypass the enum __call__ lookup the same way.
+_KEY_TYPE_VALUES = {key_type: key_type.value for key_type in KeyType}
+_KEY_TYPE_FROM_VALUE = {key_type.value: key_type for key_type in KeyType}
+
+
+def _key_type_from_value(value: str) -> KeyType:
+    try:
+        return _KEY_TYPE_FROM_VALUE[value]
+    except KeyError:
+        # Unknown values come from live responses; let the enum raise its
+        # descriptive ValueError rather than leaking a bare KeyError.
+        return KeyType(value)
+
+
+_HASH = "HASH"
+_RANGE = "RANGE"
+
+_HASH_KEY_ERROR = "hash_key must have 1-4 attributes"
+_RANGE_KEY_ERROR = "range_key must have 0-4 attributes"
+
+
+@dataclass(frozen=True, slots=True)
 class KeySpec:
     name: str
     type: KeyType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeySchema:
     """Key schema supporting single or multi-attribute partition and sort keys.
 
     For backward compatibility, single KeySpec values are accepted. For multi-attribute
-    keys (GSIs only), pass a tuple of KeySpec values.
+    keys (GSIs only), pass a tuple of KeySpec values. Both fields are normalized to
+    tuples at construction, so downstream code never branches on the input shape.
 
     DynamoDB supports up to 4 attributes each for partition (HASH) and sort (RANGE) keys.
     """
 
     hash_key: KeySpec | tuple[KeySpec, ...]
     range_key: KeySpec | tuple[KeySpec, ...] | None = None
+    _all_specs: tuple[KeySpec, ...] = field(init=False, repr=False, compare=False)
+    _encoded: list[EncodedKeySchema] = field(init=False, repr=False, compare=False)
+    _attributes: dict[str, str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        hash_keys = self._normalize(self.hash_key)
-        if not (1 <= len(hash_keys) <= 4):
-            raise ValueError("hash_key must have 1-4 attributes")
-        if self.range_key:
-            range_keys = self._normalize(self.range_key)
-            if len(range_keys) > 4:
-                raise ValueError("range_key must have 0-4 attributes")
-
-    @staticmethod
-    def _normalize(key: KeySpec | tuple[KeySpec, ...]) -> tuple[KeySpec, ...]:
-        return key if isinstance(key, tuple) else (key,)
+        hash_keys = (
+            self.hash_key if isinstance(self.hash_key, tuple) else (self.hash_key,)
+        )
+        range_keys: tuple[KeySpec, ...]
+        if self.range_key is None:
+            range_keys = ()
+        elif isinstance(self.range_key, tuple):
+            range_keys = self.range_key
+        else:
+            range_keys = (self.range_key,)
+        if not 1 <= len(hash_keys) <= 4:
+            raise ValueError(_HASH_KEY_ERROR)
+        if len(range_keys) > 4:
+            raise ValueError(_RANGE_KEY_ERROR)
+        object.__setattr__(self, "hash_key", hash_keys)
+        object.__setattr__(self, "range_key", range_keys)
+        object.__setattr__(self, "_all_specs", hash_keys + range_keys)
+        encoded: list[EncodedKeySchema] = [
+            {"AttributeName": k.name, "KeyType": _HASH} for k in hash_keys
+        ]
+        encoded.extend({"AttributeName": k.name, "KeyType": _RANGE} for k in range_keys)
+        object.__setattr__(self, "_encoded", encoded)
+        object.__setattr__(
+            self,
+            "_attributes",
+            {k.name: _KEY_TYPE_VALUES[k.type] for k in self._all_specs},
+        )
 
     def __iter__(self) -> Iterator[KeySpec]:
-        yield from self._normalize(self.hash_key)
-        if self.range_key:
-            yield from self._normalize(self.range_key)
+        return iter(self._all_specs)
+
+    def __len__(self) -> int:
+        return len(self._all_specs)
 
     def to_attributes(self) -> dict[str, str]:
-        return {key.name: key.type.value for key in self}
+        # Copy the precomputed dict so callers may merge into the result, as
+        # create_table does when collecting index attributes.
+        return self._attributes.copy()
 
     def encode(self) -> list[EncodedKeySchema]:
-        hash_keys = self._normalize(self.hash_key)
-        result: list[EncodedKeySchema] = [
-            {"AttributeName": k.name, "KeyType": "HASH"} for k in hash_keys
-        ]
-        if self.range_key:
-            range_keys = self._normalize(self.range_key)
-            result.extend(
-                {"AttributeName": k.name, "KeyType": "RANGE"} for k in range_keys
-            )
-        return result
+        return self._encoded
 
 
 class ProjectionType(Enum):
@@ -135,52 +190,71 @@ class ProjectionType(Enum):
     include = "INCLUDE"
 
 
-@dataclass(frozen=True)
+_PROJECTION_TYPE_VALUES = {
+    projection_type: projection_type.value for projection_type in ProjectionType
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Projection:
     type: ProjectionType
     attrs: list[str] | None = None
+    _encoded: EncodedProjection = field(init=False, repr=False, compare=False)
 
-    def encode(self) -> EncodedProjection:
-        encoded: EncodedProjection = {"ProjectionType": self.type.value}
+    def __post_init__(self) -> None:
+        encoded: EncodedProjection = {
+            "ProjectionType": _PROJECTION_TYPE_VALUES[self.type]
+        }
         if self.attrs:
             encoded["NonKeyAttributes"] = self.attrs
-        return encoded
+        object.__setattr__(self, "_encoded", encoded)
 
+    def encode(self) -> EncodedProjection:
+        return self._encoded
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class LocalSecondaryIndex:
     name: str
     schema: KeySchema
     projection: Projection
+    _encoded: EncodedLocalSecondaryIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_encoded",
+            {
+                "IndexName": self.name,
+                "KeySchema": self.schema.encode(),
+                "Projection": self.projection.encode(),
+            },
+        )
 
     def encode(self) -> EncodedLocalSecondaryIndex:
-        return {
-            "IndexName": self.name,
-            "KeySchema": self.schema.encode(),
-            "Projection": self.projection.encode(),
-        }
+        return self._encoded
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GlobalSecondaryIndex(LocalSecondaryIndex):
     throughput: Throughput | None
+    _encoded: EncodedGlobalSecondaryIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        encoded: EncodedGlobalSecondaryIndex = {
+            "IndexName": self.name,
+            "KeySchema": self.schema.encode(),
+            "Projection": self.projection.encode(),
+        }
+        if self.throughput is not None:
+            encoded["ProvisionedThroughput"] = {
+                "ReadCapacityUnits": self.throughput.read,
+                "WriteCapacityUnits": self.throughput.write,
+            }
+        object.__setattr__(self, "_encoded", encoded)
 
     def encode(self) -> EncodedGlobalSecondaryIndex:
-        # mypy really does not like an if/else assignment where the branches have
-        # different types, so we need to do some ridiculous casting here.
-        # The outer cst is due to https://github.com/python/mypy/issues/4122
-        # The two inner casts to Any are because of the if/else with different types
-        return cast(
-            EncodedGlobalSecondaryIndex,
-            {
-                **super().encode(),
-                **(
-                    cast(Any, self.throughput.encode())
-                    if self.throughput
-                    else cast(Any, {})
-                ),
-            },
-        )
+        return self._encoded
 
 
 class StreamViewType(Enum):
@@ -190,16 +264,23 @@ class StreamViewType(Enum):
     new_and_old_images = "NEW_AND_OLD_IMAGES"
 
 
-@dataclass(frozen=True)
+_STREAM_VIEW_TYPE_VALUES = {view_type: view_type.value for view_type in StreamViewType}
+
+
+@dataclass(frozen=True, slots=True)
 class StreamSpecification:
     enabled: bool = False
     view_type: StreamViewType = StreamViewType.new_and_old_images
+    _encoded: EncodedStreamSpecification = field(init=False, repr=False, compare=False)
 
-    def encode(self) -> EncodedStreamSpecification:
-        spec: EncodedStreamSpecification = {"StreamEnabled": self.enabled}
+    def __post_init__(self) -> None:
+        encoded: EncodedStreamSpecification = {"StreamEnabled": self.enabled}
         if self.enabled:
-            spec["StreamViewType"] = self.view_type.value
-        return spec
+            encoded["StreamViewType"] = _STREAM_VIEW_TYPE_VALUES[self.view_type]
+        object.__setattr__(self, "_encoded", encoded)
+
+    def encode(self) -> EncodedStreamSpecification:
+        return self._encoded
 
 
 class ReturnValues(Enum):
@@ -217,7 +298,17 @@ class TableStatus(Enum):
     active = "ACTIVE"
 
 
-@dataclass(frozen=True)
+_TABLE_STATUS_FROM_VALUE = {status.value: status for status in TableStatus}
+
+
+def _table_status_from_value(value: str) -> TableStatus:
+    try:
+        return _TABLE_STATUS_FROM_VALUE[value]
+    except KeyError:
+        return TableStatus(value)
+
+
+@dataclass(frozen=True, slots=True)
 class TableDescription:
     attributes: dict[str, KeyType] | None
     created: datetime.datetime | None
@@ -231,7 +322,9 @@ class TableDescription:
         attributes: dict[str, KeyType] | None
         if "AttributeDefinitions" in description:
             attributes = {
-                attribute["AttributeName"]: KeyType(attribute["AttributeType"])
+                attribute["AttributeName"]: _key_type_from_value(
+                    attribute["AttributeType"]
+                )
                 for attribute in description["AttributeDefinitions"]
             }
         else:
@@ -253,7 +346,7 @@ class TableDescription:
             "BillingModeSummary" in description
             and description["BillingModeSummary"]["BillingMode"] == PayPerRequest.MODE
         ):
-            throughput = PayPerRequest()
+            throughput = PAY_PER_REQUEST
         elif "ProvisionedThroughput" in description:
             throughput = Throughput(
                 read=description["ProvisionedThroughput"]["ReadCapacityUnits"],
@@ -267,7 +360,7 @@ class TableDescription:
             item_count=description.get("ItemCount", None),
             key_schema=key_schema,
             throughput=throughput,
-            status=TableStatus(description["TableStatus"]),
+            status=_table_status_from_value(description["TableStatus"]),
         )
 
     @staticmethod
@@ -276,24 +369,20 @@ class TableDescription:
         attributes: dict[str, KeyType],
     ) -> KeySchema:
         """Parse KeySchema from DynamoDB response, handling multi-attribute keys."""
-        hash_keys: list[KeySpec] = []
-        range_keys: list[KeySpec] = []
-
-        for key in key_schema_list:
-            name = key["AttributeName"]
-            spec = KeySpec(name=name, type=attributes[name])
-            if key["KeyType"] == "HASH":
-                hash_keys.append(spec)
-            else:
-                range_keys.append(spec)
+        hash_keys = [
+            KeySpec(name=key["AttributeName"], type=attributes[key["AttributeName"]])
+            for key in key_schema_list
+            if key["KeyType"] == _HASH
+        ]
+        range_keys = [
+            KeySpec(name=key["AttributeName"], type=attributes[key["AttributeName"]])
+            for key in key_schema_list
+            if key["KeyType"] != _HASH
+        ]
 
         return KeySchema(
-            hash_key=tuple(hash_keys) if len(hash_keys) > 1 else hash_keys[0],
-            range_key=(
-                (tuple(range_keys) if len(range_keys) > 1 else range_keys[0])
-                if range_keys
-                else None
-            ),
+            hash_key=tuple(hash_keys),
+            range_key=tuple(range_keys) if range_keys else None,
         )
 
 
@@ -308,13 +397,10 @@ class RetryTimeout(Exception):
     pass
 
 
-# https://github.com/python/mypy/issues/5374
-@dataclass(frozen=True)
-class MyPyWorkaroundRetryConfigBase:
+@dataclass(frozen=True, slots=True)
+class RetryConfig:
     time_limit_secs: Seconds = 60
 
-
-class RetryConfig(MyPyWorkaroundRetryConfigBase, metaclass=abc.ABCMeta):
     @classmethod
     def default(cls) -> RetryConfig:
         """
@@ -329,7 +415,6 @@ class RetryConfig(MyPyWorkaroundRetryConfigBase, metaclass=abc.ABCMeta):
         """
         return ExponentialBackoffRetry(time_limit_secs=500)
 
-    @abc.abstractmethod
     def delays(self) -> Iterable[Seconds]:
         """
         Custom RetryConfig classes must implement this method. It should return
@@ -347,7 +432,7 @@ class RetryConfig(MyPyWorkaroundRetryConfigBase, metaclass=abc.ABCMeta):
             await asyncio.sleep(delay)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StaticDelayRetry(RetryConfig):
     delay: Seconds = 1
 
@@ -356,7 +441,7 @@ class StaticDelayRetry(RetryConfig):
             yield self.delay
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DecorelatedJitterRetry(RetryConfig):
     base_delay_secs: Seconds = 0.05
     max_delay_secs: Seconds = 1
@@ -371,19 +456,37 @@ class DecorelatedJitterRetry(RetryConfig):
             yield current_delay_secs
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExponentialBackoffRetry(RetryConfig):
     base_delay_secs: Seconds = 2
     max_delay_secs: Seconds = 20
+    _powers: tuple[Seconds, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Powers of the base below the cap, computed once. While the power is
+        # below max_delay_secs the clamp in delays() can never bind, so those
+        # attempts skip both the exponentiation and the min().
+        powers: list[Seconds] = []
+        if self.base_delay_secs > 1:
+            power: Seconds = 1
+            while power < self.max_delay_secs and len(powers) < 32:
+                powers.append(power)
+                power *= self.base_delay_secs
+        object.__setattr__(self, "_powers", tuple(powers))
 
     def delays(self) -> Iterable[Seconds]:
-        for attempt in count():
-            yield min(
-                random.random() * (self.base_delay_secs**attempt), self.max_delay_secs
-            )
+        rand = random.random
+        for power in self._powers:
+            yield rand() * power
+        base = self.base_delay_secs
+        max_delay = self.max_delay_secs
+        power = self._powers[-1] * base if self._powers else 1
+        while True:
+            yield min(rand() * power, max_delay)
+            power *= base
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Page:
     items: list[Item]
     last_evaluated_key: dict[str, Any] | None
@@ -393,50 +496,97 @@ class Page:
         return self.last_evaluated_key is None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class StreamedPage:
+    """
+    Alternative to Page holding the raw DynamoDB items and deserializing them
+    on demand during iteration, so consumers that only iterate a page never
+    materialize the fully deserialized item list. Each iteration pass
+    deserializes the items again; use Page if items are accessed repeatedly.
+    """
+
+    raw_items: list[DynamoItem]
+    last_evaluated_key: dict[str, Any] | None
+    numeric_type: NumericTypeConverter = float
+
+    @property
+    def is_last_page(self) -> bool:
+        return self.last_evaluated_key is None
+
+    @property
+    def items(self) -> Iterator[Item]:
+        return iter(self)
+
+    def __iter__(self) -> Iterator[Item]:
+        numeric_type = self.numeric_type
+        for item in self.raw_items:
+            yield dy2py(item, numeric_type)
+
+    def __len__(self) -> int:
+        return len(self.raw_items)
+
+
+@dataclass(frozen=True, slots=True)
 class BatchGetRequest:
     keys: list[Item]
     projection: ProjectionExpression | None = None
     consistent_read: bool = False
+    _encoded_keys: list[DynamoItem | None] = field(
+        init=False, repr=False, compare=False
+    )
 
-    def to_request_payload(self) -> dict[str, Any]:
+    def __post_init__(self) -> None:
+        # Keys are encoded once and reused across retries; neither the keys
+        # nor the request may be mutated after construction.
+        object.__setattr__(self, "_encoded_keys", [py2dy(key) for key in self.keys])
+
+    def to_request_payload(
+        self, _Parameters: type[Parameters] = Parameters
+    ) -> dict[str, Any]:
         payload: dict[str, Any] = {
-            "Keys": [py2dy(key) for key in self.keys],
+            "Keys": self._encoded_keys,
             "ConsistentRead": self.consistent_read,
         }
         if self.projection:
-            params = Parameters()
+            params = _Parameters()
             payload["ProjectionExpression"] = self.projection.encode(params)
-            payload.update(params.to_request_payload())
+            params.write_into(payload)
 
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchGetResponse:
     items: dict[TableName, list[Item]]
     unprocessed_keys: dict[TableName, list[Item]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchWriteRequest:
     keys_to_delete: list[Item] | None = None
     items_to_put: list[Item] | None = None
 
-    def to_request_payload(self) -> list[dict[str, Any]]:
-        payload: list[dict[str, Any]] = []
-        if self.keys_to_delete:
-            payload.extend(
-                {"DeleteRequest": {"Key": py2dy(key)}} for key in self.keys_to_delete
-            )
-        if self.items_to_put:
-            payload.extend(
-                {"PutRequest": {"Item": py2dy(item)}} for item in self.items_to_put
-            )
+    def to_request_payload(
+        self, _py2dy: Callable[[Item], Any] = py2dy
+    ) -> list[dict[str, Any]]:
+        keys_to_delete = self.keys_to_delete or ()
+        items_to_put = self.items_to_put or ()
+        # Preallocate and fill by index to avoid list resizing; the _py2dy
+        # default argument binds the global as a local.
+        payload: list[dict[str, Any]] = [None] * (  # type: ignore[list-item]
+            len(keys_to_delete) + len(items_to_put)
+        )
+        index = 0
+        for key in keys_to_delete:
+            payload[index] = {"DeleteRequest": {"Key": _py2dy(key)}}
+            index += 1
+        for item in items_to_put:
+            payload[index] = {"PutRequest": {"Item": _py2dy(item)}}
+            index += 1
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchWriteResult:
     undeleted_keys: list[Item]
     unput_items: list[Item]
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -12,61 +13,127 @@ from aiodynamo.expressions import (
 from aiodynamo.types import Item, TableName
 from aiodynamo.utils import py2dy
 
+PayloadFunction = Callable[[Any], dict[str, Any]]
+
+# Request payloads are assembled by functions generated with exec() at import
+# time, specialized per operation shape (with or without the optional
+# projection/condition), following the same technique the stdlib dataclasses
+# module uses for __init__. A payload for an operation without optional
+# expressions collapses to a single dict literal with no dead branches.
+
+
+def _compile_payload_function(source: str) -> PayloadFunction:
+    namespace: dict[str, Any] = {
+        "py2dy": py2dy,
+        "Parameters": Parameters,
+        "EmptyItem": EmptyItem,
+    }
+    exec(compile(source, "<aiodynamo.operations>", "exec"), namespace)
+    return namespace["payload_function"]
+
+
+def _keyed_payload_functions(
+    wrapper: str, attr: str, payload_key: str, expression_attr: str, expression_key: str
+) -> dict[bool, PayloadFunction]:
+    """Build the two payload function variants for operations that serialize a
+    single item or key and optionally carry a projection or condition."""
+    plain = f"""\
+def payload_function(self, _py2dy=py2dy, _EmptyItem=EmptyItem):
+    data = _py2dy(self.{attr})
+    if not data:
+        raise _EmptyItem()
+    return {{"{wrapper}": {{"TableName": self.table, "{payload_key}": data}}}}
+"""
+    with_expression = f"""\
+def payload_function(self, _py2dy=py2dy, _Parameters=Parameters, _EmptyItem=EmptyItem):
+    data = _py2dy(self.{attr})
+    if not data:
+        raise _EmptyItem()
+    params = _Parameters()
+    payload = {{
+        "TableName": self.table,
+        "{payload_key}": data,
+        "{expression_key}": self.{expression_attr}.encode(params),
+    }}
+    params.write_into(payload)
+    return {{"{wrapper}": payload}}
+"""
+    return {
+        False: _compile_payload_function(plain),
+        True: _compile_payload_function(with_expression),
+    }
+
+
+def _update_payload_functions() -> dict[bool, PayloadFunction]:
+    """Build the two payload function variants for Update, whose update
+    expression is always encoded and whose condition is optional."""
+    condition_line = (
+        '    payload["ConditionExpression"] = self.condition.encode(params)\n'
+    )
+    template = """\
+def payload_function(self, _py2dy=py2dy, _Parameters=Parameters, _EmptyItem=EmptyItem):
+    params = _Parameters()
+    expression = self.expression.encode(params)
+    if not expression:
+        raise _EmptyItem()
+    payload = {{
+        "TableName": self.table,
+        "UpdateExpression": expression,
+        "Key": _py2dy(self.key),
+    }}
+{condition_line}    params.write_into(payload)
+    return {{"Update": payload}}
+"""
+    return {
+        False: _compile_payload_function(template.format(condition_line="")),
+        True: _compile_payload_function(template.format(condition_line=condition_line)),
+    }
+
+
+_GET_PAYLOAD = _keyed_payload_functions(
+    "Get", "key", "Key", "projection", "ProjectionExpression"
+)
+_PUT_PAYLOAD = _keyed_payload_functions(
+    "Put", "item", "Item", "condition", "ConditionExpression"
+)
+_UPDATE_PAYLOAD = _update_payload_functions()
+_DELETE_PAYLOAD = _keyed_payload_functions(
+    "Delete", "key", "Key", "condition", "ConditionExpression"
+)
+_CONDITION_CHECK_PAYLOAD = _keyed_payload_functions(
+    "ConditionCheck", "key", "Key", "condition", "ConditionExpression"
+)
+
 
 class Operation(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @abc.abstractmethod
     def to_request_payload(self) -> dict[str, Any]:
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Get(Operation):
     table: TableName
     key: Item
     projection: ProjectionExpression | None = None
 
     def to_request_payload(self) -> dict[str, Any]:
-        dynamo_key = py2dy(self.key)
-        if not dynamo_key:
-            raise EmptyItem()
-
-        payload: dict[str, Any] = {
-            "TableName": self.table,
-            "Key": dynamo_key,
-        }
-
-        if self.projection:
-            params = Parameters()
-            payload["ProjectionExpression"] = self.projection.encode(params)
-            payload.update(params.to_request_payload())
-
-        return {"Get": payload}
+        return _GET_PAYLOAD[self.projection is not None](self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Put(Operation):
     table: TableName
     item: Item
     condition: Condition | None = None
 
     def to_request_payload(self) -> dict[str, Any]:
-        dynamo_item = py2dy(self.item)
-        if not dynamo_item:
-            raise EmptyItem()
+        return _PUT_PAYLOAD[self.condition is not None](self)
 
-        payload: dict[str, Any] = {
-            "TableName": self.table,
-            "Item": dynamo_item,
-        }
-        if self.condition:
-            params = Parameters()
-            payload["ConditionExpression"] = self.condition.encode(params)
-            payload.update(params.to_request_payload())
 
-        return {"Put": payload}
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Update(Operation):
     table: TableName
     key: Item
@@ -74,66 +141,24 @@ class Update(Operation):
     condition: Condition | None = None
 
     def to_request_payload(self) -> dict[str, Any]:
-        params = Parameters()
-        expression = self.expression.encode(params)
-        if not expression:
-            raise EmptyItem()
-
-        payload: dict[str, Any] = {
-            "TableName": self.table,
-            "UpdateExpression": expression,
-            "Key": py2dy(self.key),
-        }
-
-        if self.condition:
-            payload["ConditionExpression"] = self.condition.encode(params)
+        return _UPDATE_PAYLOAD[self.condition is not None](self)
 
-        payload.update(params.to_request_payload())
 
-        return {"Update": payload}
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Delete(Operation):
     table: TableName
     key: Item
     condition: Condition | None = None
 
     def to_request_payload(self) -> dict[str, Any]:
-        dynamo_item = py2dy(self.key)
-        if not dynamo_item:
-            raise EmptyItem()
-
-        payload: dict[str, Any] = {
-            "TableName": self.table,
-            "Key": dynamo_item,
-        }
-        if self.condition:
-            params = Parameters()
-            payload["ConditionExpression"] = self.condition.encode(params)
-            payload.update(params.to_request_payload())
-
-        return {"Delete": payload}
+        return _DELETE_PAYLOAD[self.condition is not None](self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionCheck(Operation):
     table: TableName
     key: Item
     condition: Condition | None = None
 
     def to_request_payload(self) -> dict[str, Any]:
-        dynamo_item = py2dy(self.key)
-        if not dynamo_item:
-            raise EmptyItem()
-
-        payload: dict[str, Any] = {
-            "TableName": self.table,
-            "Key": dynamo_item,
-        }
-        if self.condition:
-            params = Parameters()
-            payload["ConditionExpression"] = self.condition.encode(params)
-            payload.update(params.to_request_payload())
-
-        return {"ConditionCheck": payload}
+        return _CONDITION_CHECK_PAYLOAD[self.condition is not None](self)
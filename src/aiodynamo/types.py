@@ -67,7 +67,7 @@ class EncodedLocalSecondaryIndex(TypedDict):
 
 
 class EncodedGlobalSecondaryIndex(EncodedLocalSecondaryIndex, total=False):
-    ProvisionedThroughput: EncodedThroughput
+    ProvisionedThroughput: EncodedThroughputData
 
 
 class EncodedStreamSpecificationRequired(TypedDict):
@@ -6,7 +6,6 @@ import decimal
 import logging
 from collections import abc as collections_abc
 from collections.abc import Awaitable, Callable, Mapping
-from functools import reduce
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -125,25 +124,19 @@ def low_level_serialize(value: Any) -> tuple[str, Any]:
     elif isinstance(value, bytes):
         return "B", base64.b64encode(value).decode("ascii")
     elif isinstance(value, collections_abc.Set):
-        numeric_items, str_items, byte_items, total = reduce(
-            lambda acc, item: (
-                acc[0] + isinstance(item, NUMERIC_TYPES),
-                acc[1] + isinstance(item, str),
-                acc[2] + isinstance(item, bytes),
-                acc[3] + 1,
-            ),
-            value,
-            (0, 0, 0, 0),
-        )
+        numeric_items = str_items = byte_items = total = 0
+        for item in value:
+            numeric_items += isinstance(item, NUMERIC_TYPES)
+            str_items += isinstance(item, str)
+            byte_items += isinstance(item, bytes)
+            total += 1
         if numeric_items == total:
             return "NS", [str(item) for item in value]
         elif str_items == total:
-            return "SS", [item for item in value]
+            return "SS", list(value)
         elif byte_items == total:
-            return (
-                "BS",
-                [base64.b64encode(item).decode("ascii") for item in value],
-            )
+            b64encode = base64.b64encode
+            return "BS", [b64encode(item).decode("ascii") for item in value]
         else:
             raise TypeError(
                 f"Sets which are not entirely numeric, strings or bytes are not supported. value: {value!r}"
@@ -151,7 +144,7 @@ def low_level_serialize(value: Any) -> tuple[str, Any]:
     elif isinstance(value, collections_abc.Mapping):
         return "M", serialize_dict(value)
     elif isinstance(value, collections_abc.Sequence):
-        return "L", [item for item in map(serialize, value)]
+        return "L", [serialize(item) for item in value]
     else:
         raise TypeError(f"Unsupported type {type(value)}: {value!r}")
 
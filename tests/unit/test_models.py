@@ -1,6 +1,8 @@
+from decimal import Decimal
+
 import pytest
 
-from aiodynamo.models import KeySchema, KeySpec, KeyType
+from aiodynamo.models import KeySchema, KeySpec, KeyType, StreamedPage
 
 
 class TestKeySchema:
@@ -134,3 +136,48 @@ class TestKeySchemaValidation:
                     KeySpec("sk5", KeyType.string),
                 ),
             )
+
+
+class TestStreamedPage:
+    """Tests for lazy item deserialization in StreamedPage."""
+
+    raw_items = [
+        {"h": {"S": "first"}, "n": {"N": "1"}},
+        {"h": {"S": "second"}, "n": {"N": "2"}},
+    ]
+
+    def test_iteration_deserializes_items(self) -> None:
+        """Test that iterating yields deserialized items in order."""
+        page = StreamedPage(raw_items=self.raw_items, last_evaluated_key=None)
+        assert list(page) == [
+            {"h": "first", "n": 1.0},
+            {"h": "second", "n": 2.0},
+        ]
+
+    def test_items_is_lazy(self) -> None:
+        """Test that items returns a fresh iterator over deserialized items."""
+        page = StreamedPage(raw_items=self.raw_items, last_evaluated_key=None)
+        items = page.items
+        assert next(items) == {"h": "first", "n": 1.0}
+        assert list(page.items) == list(page)
+
+    def test_len_without_deserializing(self) -> None:
+        """Test that len reflects the raw item count."""
+        page = StreamedPage(raw_items=self.raw_items, last_evaluated_key=None)
+        assert len(page) == 2
+
+    def test_numeric_type(self) -> None:
+        """Test that numbers are converted through numeric_type."""
+        page = StreamedPage(
+            raw_items=self.raw_items,
+            last_evaluated_key=None,
+            numeric_type=Decimal,
+        )
+        assert [item["n"] for item in page] == [Decimal("1"), Decimal("2")]
+
+    def test_is_last_page(self) -> None:
+        """Test that is_last_page mirrors last_evaluated_key."""
+        assert StreamedPage(raw_items=[], last_evaluated_key=None).is_last_page
+        assert not StreamedPage(
+            raw_items=[], last_evaluated_key={"h": "first"}
+        ).is_last_page